@@ -22,8 +22,10 @@ Also checks a collection of other documents:
   want to be able to freeze the versioned references for releases)
 """
 
+import concurrent.futures
 import difflib
 import functools
+import hashlib
 import os
 import re
 
@@ -38,6 +40,19 @@ RELEASE_INDEX_FILE = os.path.join(
 )
 DEVELOPMENT_TEMPLATE = os.path.join(_ROOT_DIR, "DEVELOPMENT.rst.template")
 DEVELOPMENT_FILE = os.path.join(_ROOT_DIR, "DEVELOPMENT.rst")
+CACHE_FILE = os.path.join(_ROOT_DIR, ".check_doc_templates.cache")
+# NOTE: This script is included since the template values are defined here.
+CACHE_INPUTS = (
+    os.path.abspath(__file__),
+    TEMPLATE_FILE,
+    README_FILE,
+    RELEASE_README_FILE,
+    INDEX_FILE,
+    RELEASE_INDEX_FILE,
+    DEVELOPMENT_TEMPLATE,
+    DEVELOPMENT_FILE,
+)
+DIFF_LINE_LIMIT = 20000
 RTD_VERSION = "latest"
 REVISION = "main"
 PLAIN_CODE_BLOCK = ".. code-block:: python"
@@ -203,6 +218,38 @@ CITATION = """\
    }"""
 
 
+@functools.lru_cache(maxsize=None)
+def read_file(filename):
+    """Read the contents of a text file.
+
+    Results are cached, since several checks share the same files.
+
+    Args:
+        filename (str): The file to be read.
+
+    Returns:
+        str: The contents of the file.
+    """
+    with open(filename, "r") as file_obj:
+        return file_obj.read()
+
+
+def read_all_files(filenames):
+    """Read a collection of files concurrently.
+
+    This populates the cache for :func:`read_file` so that the I/O for each
+    file overlaps rather than happening serially.
+
+    Args:
+        filenames (Tuple[str, ...]): The files to be read.
+
+    Returns:
+        List[str]: The contents of each file.
+    """
+    with concurrent.futures.ThreadPoolExecutor(len(filenames)) as executor:
+        return list(executor.map(read_file, filenames))
+
+
 def inline_math(match):
     """Convert Sphinx inline math to plain reST literal.
 
@@ -251,6 +298,10 @@ def doc_replace(match, sphinx_docs):
 def get_diff(value1, value2, name1, name2):
     """Get a diff between two strings.
 
+    Only intended to be called once the strings are known to differ. For
+    very large inputs the diff is omitted, since computing it can be
+    quadratic in the number of lines.
+
     Args:
         value1 (str): First string to be compared.
         value2 (str): Second string to be compared.
@@ -258,12 +309,17 @@ def get_diff(value1, value2, name1, name2):
         name2 (str): Name of the second string.
 
     Returns:
-        str: The full diff.
+        str: The full (unified) diff.
     """
     lines1 = [line + "\n" for line in value1.splitlines()]
     lines2 = [line + "\n" for line in value2.splitlines()]
-    diff_lines = difflib.context_diff(
-        lines1, lines2, fromfile=name1, tofile=name2
+    if max(len(lines1), len(lines2)) > DIFF_LINE_LIMIT:
+        return "{} and {} differ (diff omitted, too many lines)\n".format(
+            name1, name2
+        )
+
+    diff_lines = difflib.unified_diff(
+        lines1, lines2, fromfile=name1, tofile=name2, n=3
     )
     return "".join(diff_lines)
 
@@ -285,8 +341,7 @@ def populate_readme(revision, rtd_version, **extra_kwargs):
         ValueError: If the ``sphinx_modules`` encountered are not as expected.
         ValueError: If the ``sphinx_docs`` encountered are not as expected.
     """
-    with open(TEMPLATE_FILE, "r") as file_obj:
-        template = file_obj.read()
+    template = read_file(TEMPLATE_FILE)
     img_prefix = IMG_PREFIX.format(revision=revision)
     extra_links = EXTRA_LINKS.format(
         rtd_version=rtd_version, revision=revision
@@ -356,8 +411,7 @@ def readme_verify():
     """
     expected = populate_readme(REVISION, RTD_VERSION)
     # Actually get the stored contents.
-    with open(README_FILE, "r") as file_obj:
-        contents = file_obj.read()
+    contents = read_file(README_FILE)
     if contents != expected:
         err_msg = "\n" + get_diff(
             contents, expected, "README.rst.actual", "README.rst.expected"
@@ -395,8 +449,7 @@ def release_readme_verify():
         coveralls_path="builds/{coveralls_build}",
         citation=CITATION.replace("{", "{{").replace("}", "}}"),
     )
-    with open(RELEASE_README_FILE, "r") as file_obj:
-        contents = file_obj.read()
+    contents = read_file(RELEASE_README_FILE)
     if contents != expected:
         err_msg = "\n" + get_diff(
             contents,
@@ -426,8 +479,7 @@ def _index_verify(index_file, **extra_kwargs):
             expected value computed from the template.
     """
     side_effect = extra_kwargs.pop("side_effect", None)
-    with open(TEMPLATE_FILE, "r") as file_obj:
-        template = file_obj.read()
+    template = read_file(TEMPLATE_FILE)
     template_kwargs = {
         "code_block1": SPHINX_CODE_BLOCK1,
         "code_block2": SPHINX_CODE_BLOCK2,
@@ -465,8 +517,7 @@ def _index_verify(index_file, **extra_kwargs):
     expected = template.format(**template_kwargs)
     if side_effect is not None:
         expected = side_effect(expected)
-    with open(index_file, "r") as file_obj:
-        contents = file_obj.read()
+    contents = read_file(index_file)
     if contents != expected:
         err_msg = "\n" + get_diff(
             contents,
@@ -547,11 +598,9 @@ def development_verify():
         ValueError: If the current ``DEVELOPMENT.rst`` doesn't
             agree with the expected value computed from the template.
     """
-    with open(DEVELOPMENT_TEMPLATE, "r") as file_obj:
-        template = file_obj.read()
+    template = read_file(DEVELOPMENT_TEMPLATE)
     expected = template.format(revision=REVISION, rtd_version=RTD_VERSION)
-    with open(DEVELOPMENT_FILE, "r") as file_obj:
-        contents = file_obj.read()
+    contents = read_file(DEVELOPMENT_FILE)
     if contents != expected:
         err_msg = "\n" + get_diff(
             contents,
@@ -565,13 +614,67 @@ def development_verify():
         print("DEVELOPMENT.rst contents are as expected.")
 
 
+def get_inputs_digest():
+    """Compute a hash of all files used by the checks in this script.
+
+    Returns:
+        str: The SHA-256 hex digest of the contents of ``CACHE_INPUTS``.
+    """
+    hash_obj = hashlib.sha256()
+    for contents in read_all_files(CACHE_INPUTS):
+        contents = contents.encode("utf-8")
+        # Include the length so that content can't "move" between files.
+        hash_obj.update(str(len(contents)).encode("ascii"))
+        hash_obj.update(contents)
+    return hash_obj.hexdigest()
+
+
+def read_cached_digest():
+    """Read the digest stored by the last successful run (if any).
+
+    Returns:
+        Optional[str]: The stored digest, or :data:`None` if there is no
+        cache file.
+    """
+    try:
+        with open(CACHE_FILE, "r") as file_obj:
+            return file_obj.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def write_cached_digest(digest):
+    """Store the digest of a successful run.
+
+    Writes to a temporary file first so that an interrupted run can't
+    leave a partial digest behind.
+
+    Args:
+        digest (str): The digest to be stored.
+    """
+    tmp_file = CACHE_FILE + ".tmp"
+    with open(tmp_file, "w") as file_obj:
+        file_obj.write(digest + "\n")
+    os.replace(tmp_file, CACHE_FILE)
+
+
 def main():
-    """Verify specialized versions of ``README.rst.template``."""
+    """Verify specialized versions of ``README.rst.template``.
+
+    Skips the checks if none of the inputs have changed since the last
+    successful run.
+    """
+    digest = get_inputs_digest()
+    if digest == read_cached_digest():
+        print("Document templates are up to date.")
+        return
+
     readme_verify()
     release_readme_verify()
     docs_index_verify()
     release_docs_index_verify()
     development_verify()
+    write_cached_digest(digest)
 
 
 if __name__ == "__main__":
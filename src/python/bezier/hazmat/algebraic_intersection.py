@@ -40,6 +40,9 @@ is the "intersection polynomial" for :math:`t`.
    :trim:
 """
 
+import collections
+import threading
+
 import numpy as np
 from numpy.polynomial import polynomial
 
@@ -51,50 +54,14 @@ from bezier.hazmat import geometric_intersection
 from bezier.hazmat import helpers as _py_helpers
 
 
-# NOTE: These are hardcoded from:
-#         0.5 * (np.cos(np.pi * np.arange(1, 14, 2.0) / 14) + 1.0)
-#         0.5 * (np.cos(np.pi * np.arange(1, 18, 2.0) / 18) + 1.0)
-#         0.5 * (np.cos(np.pi * np.arange(1, 20, 2.0) / 20) + 1.0)
-#       See 73f909805e971221cb7976cf69603b82f31a4a32 and
-#       80907b1be03f5895f7132e0e920c5e3cdebba9ac.
-_CHEB7 = np.asfortranarray(
-    [
-        float.fromhex("0x1.f994e02ac74b4p-1"),
-        float.fromhex("0x1.c8261ba82ef26p-1"),
-        float.fromhex("0x1.6f130135c6af0p-1"),
-        float.fromhex("0x1.0000000000000p-1"),
-        float.fromhex("0x1.21d9fd9472a20p-2"),
-        float.fromhex("0x1.becf22be886e0p-4"),
-        float.fromhex("0x1.9ac7f54e2d2c0p-7"),
-    ]
-)
-_CHEB9 = np.asfortranarray(
-    [
-        float.fromhex("0x1.fc1c5c6408e0cp-1"),
-        float.fromhex("0x1.ddb3d742c2656p-1"),
-        float.fromhex("0x1.a48dba91e0b0ep-1"),
-        float.fromhex("0x1.578ea1d2282fep-1"),
-        float.fromhex("0x1.0000000000000p-1"),
-        float.fromhex("0x1.50e2bc5bafa08p-2"),
-        float.fromhex("0x1.6dc915b87d3c6p-3"),
-        float.fromhex("0x1.126145e9ecd5cp-4"),
-        float.fromhex("0x1.f1d1cdfb8fa40p-8"),
-    ]
-)
-_CHEB10 = np.asfortranarray(
-    [
-        float.fromhex("0x1.fcd924a17f22ep-1"),
-        float.fromhex("0x1.e41900e9e9636p-1"),
-        float.fromhex("0x1.b504f333f9de6p-1"),
-        float.fromhex("0x1.7438b8ad13780p-1"),
-        float.fromhex("0x1.280c16cf50a6fp-1"),
-        float.fromhex("0x1.afe7d2615eb25p-2"),
-        float.fromhex("0x1.178e8ea5d9100p-2"),
-        float.fromhex("0x1.2bec333018868p-3"),
-        float.fromhex("0x1.be6ff16169ca0p-5"),
-        float.fromhex("0x1.936daf406e940p-8"),
-    ]
-)
+# NOTE: These are the binomial coefficients binom(n, k) for k = 0, ..., n,
+#       keyed by the number of coefficients ``n + 1``.
+_BINOMIAL_ROWS = {
+    2: np.asfortranarray([1.0, 1.0]),
+    3: np.asfortranarray([1.0, 2.0, 1.0]),
+    4: np.asfortranarray([1.0, 3.0, 3.0, 1.0]),
+    5: np.asfortranarray([1.0, 4.0, 6.0, 4.0, 1.0]),
+}
 # Allow a buffer of sqrt(sqrt(machine precision)) for polynomial roots.
 _IMAGINARY_WIGGLE = 0.5 ** 13
 _UNIT_INTERVAL_WIGGLE_START = -(0.5 ** 13)
@@ -112,32 +79,151 @@ _POWER_BASIS_ERR = (
     "Currently only supporting degree pairs "
     "1-1, 1-2, 1-3, 1-4, 2-2, 2-3, 2-4 and 3-3."
 )
+# NOTE: The same pair of curves may be converted to the power basis many
+#       times, so a bounded number of results are kept (and evicted in least
+#       recently used order).
+_POWER_BASIS_CACHE = collections.OrderedDict()
+_POWER_BASIS_CACHE_SIZE = 1024
+_POWER_BASIS_LOCK = threading.Lock()
+# NOTE: Reusable (per-thread) storage for evaluating a curve at a single
+#       parameter, to avoid allocating a 1-element array for each call.
+_SCRATCH = threading.local()
 _LINEARIZATION = geometric_intersection.Linearization
 _DISJOINT = geometric_intersection.BoxIntersectionType.DISJOINT
 
 
+def _evaluate1(nodes, x_val, y_val):
+    """Helper for :func:`evaluate` when ``nodes`` is degree 1.
+
+    Only uses elementwise arithmetic, so ``x_val`` and ``y_val`` may
+    also be arrays of the same shape.
+
+    Args:
+        nodes (numpy.ndarray): ``2 x 2`` array of nodes in a curve.
+        x_val (Union[float, numpy.ndarray]): ``x``-coordinate(s) for
+            evaluation.
+        y_val (Union[float, numpy.ndarray]): ``y``-coordinate(s) for
+            evaluation.
+
+    Returns:
+        Union[float, numpy.ndarray]: The computed value(s) of
+        :math:`f(x, y)`.
+    """
+    # x(s) - x = (x0 - x) (1 - s) + (x1 - x) s
+    # y(s) - y = (y0 - y) (1 - s) + (y1 - y) s
+    # Modified Sylvester: [x0 - x, x1 - x]
+    #                     [y0 - y, y1 - y]
+    (x0, x1), (y0, y1) = nodes.tolist()
+    return (x0 - x_val) * (y1 - y_val) - (x1 - x_val) * (y0 - y_val)
+
+
+def _evaluate2(nodes, x_val, y_val):
+    """Helper for :func:`evaluate` when ``nodes`` is degree 2.
+
+    Only uses elementwise arithmetic, so ``x_val`` and ``y_val`` may
+    also be arrays of the same shape.
+
+    Args:
+        nodes (numpy.ndarray): ``2 x 3`` array of nodes in a curve.
+        x_val (Union[float, numpy.ndarray]): ``x``-coordinate(s) for
+            evaluation.
+        y_val (Union[float, numpy.ndarray]): ``y``-coordinate(s) for
+            evaluation.
+
+    Returns:
+        Union[float, numpy.ndarray]: The computed value(s) of
+        :math:`f(x, y)`.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    # x(s) - x = (x0 - x) (1 - s)^2 + 2 (x1 - x) s(1 - s) + (x2 - x) s^2
+    # y(s) - y = (y0 - y) (1 - s)^2 + 2 (y1 - y) s(1 - s) + (y2 - y) s^2
+    # Modified Sylvester: [x0 - x, 2(x1 - x),    x2 - x,      0] = A|B|C|0
+    #                     [     0,    x0 - x, 2(x1 - x), x2 - x]   0|A|B|C
+    #                     [y0 - y, 2(y1 - y),    y2 - y,      0]   D|E|F|0
+    #                     [     0,    y0 - y, 2(y1 - y), y2 - y]   0|D|E|F
+    (x0, x1, x2), (y0, y1, y2) = nodes.tolist()
+    val_a = x0 - x_val
+    val_b = 2.0 * (x1 - x_val)
+    val_c = x2 - x_val
+    val_d = y0 - y_val
+    val_e = 2.0 * (y1 - y_val)
+    val_f = y2 - y_val
+    #     [A, B, C]         [E, F, 0]
+    # det [E, F, 0] = - det [A, B, C] = -E (BF - CE) + F(AF - CD)
+    #     [D, E, F]         [D, E, F]
+    sub1 = val_b * val_f - val_c * val_e
+    sub2 = val_a * val_f - val_c * val_d
+    sub_det_a = -val_e * sub1 + val_f * sub2
+    #     [B, C, 0]
+    # det [A, B, C] = B (BF - CE) - C (AF - CD)
+    #     [D, E, F]
+    sub_det_d = val_b * sub1 - val_c * sub2
+    return val_a * sub_det_a + val_d * sub_det_d
+
+
 def _evaluate3(nodes, x_val, y_val):
     """Helper for :func:`evaluate` when ``nodes`` is degree 3.
 
+    Only uses elementwise arithmetic, so ``x_val`` and ``y_val`` may
+    also be arrays of the same shape.
+
     Args:
         nodes (numpy.ndarray): ``2 x 4`` array of nodes in a curve.
-        x_val (float): ``x``-coordinate for evaluation.
-        y_val (float): ``y``-coordinate for evaluation.
+        x_val (Union[float, numpy.ndarray]): ``x``-coordinate(s) for
+            evaluation.
+        y_val (Union[float, numpy.ndarray]): ``y``-coordinate(s) for
+            evaluation.
 
     Returns:
-        float: The computed value of :math:`f(x, y)`.
+        Union[float, numpy.ndarray]: The computed value(s) of
+        :math:`f(x, y)`.
     """
-    # NOTE: This may be (a) slower and (b) less precise than
-    #       hard-coding the determinant.
-    sylvester_mat = np.zeros((6, 6), order="F")
-    delta = nodes - np.asfortranarray([[x_val], [y_val]])
-    delta[:, 1:3] *= 3.0
-    # Swap rows/columns so that x-y are right next to each other.
-    # This will only change the determinant up to a sign.
-    sylvester_mat[:2, :4] = delta
-    sylvester_mat[2:4, 1:5] = delta
-    sylvester_mat[4:, 2:] = delta
-    return np.linalg.det(sylvester_mat)
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    # x(s) - x = (x0 - x) (1 - s)^3 + 3 (x1 - x) s(1 - s)^2 + ...
+    # Modified Sylvester: [A, B, C, D, 0, 0]
+    #                     [E, F, G, H, 0, 0]
+    #                     [0, A, B, C, D, 0]
+    #                     [0, E, F, G, H, 0]
+    #                     [0, 0, A, B, C, D]
+    #                     [0, 0, E, F, G, H]
+    # (with x-y rows swapped next to each other, which will only change
+    # the determinant up to a sign). Rather than computing this 6 x 6
+    # determinant directly, we use the (equal) determinant of the 3 x 3
+    # Bezout matrix, whose entries are 2 x 2 minors M_ij of the matrix
+    # [A, B, C, D]
+    # [E, F, G, H]
+    (x0, x1, x2, x3), (y0, y1, y2, y3) = nodes.tolist()
+    val_a = x0 - x_val
+    val_b = 3.0 * (x1 - x_val)
+    val_c = 3.0 * (x2 - x_val)
+    val_d = x3 - x_val
+    val_e = y0 - y_val
+    val_f = 3.0 * (y1 - y_val)
+    val_g = 3.0 * (y2 - y_val)
+    val_h = y3 - y_val
+    minor01 = val_a * val_f - val_b * val_e
+    minor02 = val_a * val_g - val_c * val_e
+    minor03 = val_a * val_h - val_d * val_e
+    minor12 = val_b * val_g - val_c * val_f
+    minor13 = val_b * val_h - val_d * val_f
+    minor23 = val_c * val_h - val_d * val_g
+    #     [M01, M02,       M03]
+    # det [M02, M03 + M12, M13]
+    #     [M03, M13,       M23]
+    minor_mid = minor03 + minor12
+    return (
+        minor01 * (minor_mid * minor23 - minor13 * minor13)
+        - minor02 * (minor02 * minor23 - minor13 * minor03)
+        + minor03 * (minor02 * minor13 - minor_mid * minor03)
+    )
+
+
+# NOTE: These map the number of nodes to the helper for that degree.
+_EVALUATE_HELPERS = {2: _evaluate1, 3: _evaluate2, 4: _evaluate3}
 
 
 def evaluate(nodes, x_val, y_val):
@@ -168,46 +254,40 @@ def evaluate(nodes, x_val, y_val):
         ValueError: If the curve is a point.
         .UnsupportedDegree: If the degree is not 1, 2 or 3.
     """
+    # NOTE: The helpers unpack ``nodes`` into Python ``float`` values, which
+    #       makes evaluating at a single point much cheaper than doing the
+    #       same arithmetic on NumPy scalars. This also means that the
+    #       memory layout of ``nodes`` (e.g. C- or Fortran-order) does not
+    #       matter, so it is never copied into a canonical layout.
     _, num_nodes = nodes.shape
     if num_nodes == 1:
         raise ValueError("A point cannot be implicitized")
 
-    if num_nodes == 2:
-        # x(s) - x = (x0 - x) (1 - s) + (x1 - x) s
-        # y(s) - y = (y0 - y) (1 - s) + (y1 - y) s
-        # Modified Sylvester: [x0 - x, x1 - x]
-        #                     [y0 - y, y1 - y]
-        return (nodes[0, 0] - x_val) * (nodes[1, 1] - y_val) - (
-            nodes[0, 1] - x_val
-        ) * (nodes[1, 0] - y_val)
-
-    if num_nodes == 3:
-        # x(s) - x = (x0 - x) (1 - s)^2 + 2 (x1 - x) s(1 - s) + (x2 - x) s^2
-        # y(s) - y = (y0 - y) (1 - s)^2 + 2 (y1 - y) s(1 - s) + (y2 - y) s^2
-        # Modified Sylvester: [x0 - x, 2(x1 - x),    x2 - x,      0] = A|B|C|0
-        #                     [     0,    x0 - x, 2(x1 - x), x2 - x]   0|A|B|C
-        #                     [y0 - y, 2(y1 - y),    y2 - y,      0]   D|E|F|0
-        #                     [     0,    y0 - y, 2(y1 - y), y2 - y]   0|D|E|F
-        val_a, val_b, val_c = nodes[0, :] - x_val
-        val_b *= 2
-        val_d, val_e, val_f = nodes[1, :] - y_val
-        val_e *= 2
-        #     [A, B, C]         [E, F, 0]
-        # det [E, F, 0] = - det [A, B, C] = -E (BF - CE) + F(AF - CD)
-        #     [D, E, F]         [D, E, F]
-        sub1 = val_b * val_f - val_c * val_e
-        sub2 = val_a * val_f - val_c * val_d
-        sub_det_a = -val_e * sub1 + val_f * sub2
-        #     [B, C, 0]
-        # det [A, B, C] = B (BF - CE) - C (AF - CD)
-        #     [D, E, F]
-        sub_det_d = val_b * sub1 - val_c * sub2
-        return val_a * sub_det_a + val_d * sub_det_d
-
-    if num_nodes == 4:
-        return _evaluate3(nodes, x_val, y_val)
-
-    raise _py_helpers.UnsupportedDegree(num_nodes - 1, supported=(1, 2, 3))
+    helper = _EVALUATE_HELPERS.get(num_nodes)
+    if helper is None:
+        raise _py_helpers.UnsupportedDegree(num_nodes - 1, supported=(1, 2, 3))
+
+    return helper(nodes, x_val, y_val)
+
+
+def _scratch_s(s_val):
+    """Get a reusable 1-element array containing a curve parameter.
+
+    The array is local to the current thread and is overwritten on every
+    call, so it should be used immediately.
+
+    Args:
+        s_val (float): The parameter to store.
+
+    Returns:
+        numpy.ndarray: The ``1``-array ``[s_val]``.
+    """
+    s_vals = getattr(_SCRATCH, "s_vals", None)
+    if s_vals is None:
+        s_vals = np.empty((1,), order="F")
+        _SCRATCH.s_vals = s_vals
+    s_vals[0] = s_val
+    return s_vals
 
 
 def eval_intersection_polynomial(nodes1, nodes2, t):
@@ -231,257 +311,295 @@ def eval_intersection_polynomial(nodes1, nodes2, t):
     Returns:
         float: The computed value of :math:`f_1(x_2(t), y_2(t))`.
     """
-    (x_val,), (y_val,) = _curve_helpers.evaluate_multi(
-        nodes2, np.asfortranarray([t])
-    )
+    (x_val,), (y_val,) = _curve_helpers.evaluate_multi(nodes2, _scratch_s(t))
     return evaluate(nodes1, x_val, y_val)
 
 
-def _to_power_basis11(nodes1, nodes2):
-    r"""Compute the coefficients of an **intersection polynomial**.
+def _bernstein_to_power(coeffs):
+    r"""Convert coefficients from the Bernstein basis to the power basis.
 
-    Helper for :func:`to_power_basis` in the case that each curve is
-    degree one. In this case, B |eacute| zout's `theorem`_ tells us
-    that the **intersection polynomial** is degree :math:`1 \cdot 1`
-    hence we return two coefficients.
+    Uses the fact that the coefficient of :math:`t^k` is
+    :math:`\binom{n}{k}` times the :math:`k`-th forward difference of
+    the coefficients in the Bernstein basis.
+
+    .. note::
+
+       This converts ``coeffs`` **in place** (along the last axis), so
+       that several polynomials of the same degree can be converted at
+       once.
 
     Args:
-        nodes1 (numpy.ndarray): The nodes in the first curve.
-        nodes2 (numpy.ndarray): The nodes in the second curve.
+        coeffs (numpy.ndarray): Array of coefficients in the Bernstein
+            basis, of degree at most four.
 
     Returns:
-        numpy.ndarray: ``2``-array of coefficients.
+        numpy.ndarray: The same array, now holding the coefficients in
+        the power basis.
     """
-    # We manually invert the Vandermonde matrix:
-    # [1 0][c0] = [n0]
-    # [1 1][c1]   [n1]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] = [ 1 0][n0]
-    # [c1] = [-1 1][n1]
-    return np.asfortranarray([val0, -val0 + val1])
+    num_coeffs = coeffs.shape[-1]
+    for index in range(1, num_coeffs):
+        coeffs[..., index:] -= coeffs[..., index - 1 : -1]  # noqa: E203
+    coeffs *= _BINOMIAL_ROWS[num_coeffs]
+    return coeffs
 
 
-def _to_power_basis12(nodes1, nodes2):
-    r"""Compute the coefficients of an **intersection polynomial**.
+def _sylvester_minors(nodes1, nodes2):
+    r"""Compute the minors of the modified Sylvester matrix along a curve.
 
-    Helper for :func:`to_power_basis` in the case that the first curve is
-    degree one and the second is degree two. In this case, B |eacute| zout's
-    `theorem`_ tells us that the **intersection polynomial** is
-    degree :math:`1 \cdot 2` hence we return three coefficients.
+    The implicitization of ``nodes1`` is a determinant whose entries are
+    built from the :math:`2 \times 2` minors :math:`M_{ij}(x, y)` of
+
+    .. math::
+
+       \left[\begin{array}{c c c}
+           \binom{n}{0} (x_0 - x) & \cdots & \binom{n}{n} (x_n - x) \\
+           \binom{n}{0} (y_0 - y) & \cdots & \binom{n}{n} (y_n - y)
+       \end{array}\right]
+
+    (see :func:`_evaluate3`). Each of these minors is **affine** in
+    :math:`x` and :math:`y` (the :math:`xy` terms cancel), so plugging in
+    the second curve gives a polynomial in :math:`t` whose coefficients
+    in the Bernstein basis are just :math:`M_{ij}` evaluated at each of
+    the nodes of the second curve.
 
     Args:
-        nodes1 (numpy.ndarray): The nodes in the first curve.
-        nodes2 (numpy.ndarray): The nodes in the second curve.
+        nodes1 (numpy.ndarray): The nodes in the first curve. May also be
+            a stack of ``K`` curves (i.e. a ``K x 2 x N`` array).
+        nodes2 (numpy.ndarray): The nodes in the second curve. May also be
+            a stack of ``K`` curves (i.e. a ``K x 2 x M`` array).
 
     Returns:
-        numpy.ndarray: ``3``-array of coefficients.
+        numpy.ndarray: ``N x N x M`` array, where the ``(i, j)`` entry
+        holds the coefficients of :math:`M_{ij}(x_2(t), y_2(t))` in the
+        power basis (here ``N`` and ``M`` are the number of nodes in each
+        curve). For stacks of curves, this is ``K x N x N x M``.
     """
-    # We manually invert the Vandermonde matrix:
-    # [1 0   0  ][c0] = [n0]
-    # [1 1/2 1/4][c1]   [n1]
-    # [1 1   1  ][c2]   [n2]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 0.5)
-    val2 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] = [ 1  0  0][n0]
-    # [c1] = [-3  4 -1][n1]
-    # [c2] = [ 2 -4  2][n2]
-    return np.asfortranarray(
-        [
-            val0,
-            -3.0 * val0 + 4.0 * val1 - val2,
-            2.0 * val0 - 4.0 * val1 + 2.0 * val2,
-        ]
+    num_nodes1 = nodes1.shape[-1]
+    weights = _BINOMIAL_ROWS[num_nodes1][:, np.newaxis]
+    delta_x = weights * (
+        nodes1[..., 0, :, np.newaxis] - nodes2[..., 0, np.newaxis, :]
+    )
+    delta_y = weights * (
+        nodes1[..., 1, :, np.newaxis] - nodes2[..., 1, np.newaxis, :]
     )
+    minors = (
+        delta_x[..., :, np.newaxis, :] * delta_y[..., np.newaxis, :, :]
+        - delta_x[..., np.newaxis, :, :] * delta_y[..., :, np.newaxis, :]
+    )
+    return _bernstein_to_power(minors)
 
 
-def _to_power_basis13(nodes1, nodes2):
-    r"""Compute the coefficients of an **intersection polynomial**.
+def _polymul(coeffs1, coeffs2):
+    """Multiply two polynomials in the power basis.
 
-    Helper for :func:`to_power_basis` in the case that the first curve is
-    degree one and the second is degree three. In this case, B |eacute| zout's
-    `theorem`_ tells us that the **intersection polynomial** is
-    degree :math:`1 \cdot 3` hence we return four coefficients.
+    For a single pair of polynomials this is just :func:`numpy.convolve`.
+    For stacks of polynomials (i.e. coefficients along the last axis), the
+    product is accumulated one coefficient of ``coeffs1`` at a time, with
+    each step vectorized across the whole stack.
 
     Args:
-        nodes1 (numpy.ndarray): The nodes in the first curve.
-        nodes2 (numpy.ndarray): The nodes in the second curve.
+        coeffs1 (numpy.ndarray): Coefficients of the first polynomial(s).
+        coeffs2 (numpy.ndarray): Coefficients of the second polynomial(s).
 
     Returns:
-        numpy.ndarray: ``4``-array of coefficients.
+        numpy.ndarray: Coefficients of the product(s).
     """
-    # We manually invert the Vandermonde matrix:
-    # Use exact f.p. numbers to avoid round-off wherever possible.
-    # [1 0   0    0    ][c0] = [n0]
-    # [1 1/4 1/16 1/64 ][c1]   [n1]
-    # [1 3/4 9/16 27/64][c2]   [n2]
-    # [1 1   1    1    ][c3]   [n3]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 0.25)
-    val2 = eval_intersection_polynomial(nodes1, nodes2, 0.75)
-    val3 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] =       [  3   0   0   0][n0]
-    # [c1] = 1 / 3 [-19  24  -8   3][n1]
-    # [c2] =       [ 32 -56  40 -16][n2]
-    # [c3] =       [-16  32 -32  16][n3]
-    # Since polynomial coefficients, we don't need to divide by 3
-    # to get the same polynomial. Avoid the division to avoid round-off.
-    return np.asfortranarray(
-        [
-            3.0 * val0,
-            -19.0 * val0 + 24.0 * val1 - 8.0 * val2 + 3.0 * val3,
-            32.0 * val0 - 56.0 * val1 + 40.0 * val2 - 16.0 * val3,
-            -16.0 * val0 + 32.0 * val1 - 32.0 * val2 + 16.0 * val3,
-        ]
+    if coeffs1.ndim == 1:
+        return np.convolve(coeffs1, coeffs2)
+
+    num_coeffs1 = coeffs1.shape[-1]
+    num_coeffs2 = coeffs2.shape[-1]
+    product = np.zeros(
+        coeffs1.shape[:-1] + (num_coeffs1 + num_coeffs2 - 1,), order="F"
     )
+    for index in range(num_coeffs1):
+        product[..., index : index + num_coeffs2] += (  # noqa: E203
+            coeffs1[..., index, np.newaxis] * coeffs2
+        )
+    return product
 
 
-def _to_power_basis_degree4(nodes1, nodes2):
+def _to_power_basis_linear(nodes1, nodes2):
     r"""Compute the coefficients of an **intersection polynomial**.
 
-    Helper for :func:`to_power_basis` in the case that B |eacute| zout's
-    `theorem`_ tells us the **intersection polynomial** is degree
-    :math:`4`. This happens if the two curves have degrees two and two
-    or have degrees one and four.
+    Helper for :func:`to_power_basis` in the case that the first curve is
+    degree one. In this case, B |eacute| zout's `theorem`_ tells us that
+    the **intersection polynomial** has the same degree as the second
+    curve.
+
+    Since the implicitized line
+
+    .. math::
+
+       f_1(x, y) = (x_0 y_1 - x_1 y_0) + (y_0 - y_1) x + (x_1 - x_0) y
+
+    is affine, plugging in the second curve gives a polynomial whose
+    coefficients in the Bernstein basis are just :math:`f_1` evaluated at
+    each of the nodes of the second curve. So the coefficients can be
+    computed directly, rather than by sampling the polynomial and
+    inverting a Vandermonde matrix.
 
     Args:
         nodes1 (numpy.ndarray): The nodes in the first curve.
         nodes2 (numpy.ndarray): The nodes in the second curve.
 
     Returns:
-        numpy.ndarray: ``5``-array of coefficients.
+        numpy.ndarray: Array of coefficients.
     """
-    # We manually invert the Vandermonde matrix:
-    # [1 0   0    0     0     ][c0] = [n0]
-    # [1 1/4 1/16 1/64  1/256 ][c1]   [n1]
-    # [1 1/2 1/4  1/8   1/16  ][c2]   [n2]
-    # [1 3/4 9/16 27/64 81/256][c3]   [n3]
-    # [1 1   1    1     1     ][c4]   [n4]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 0.25)
-    val2 = eval_intersection_polynomial(nodes1, nodes2, 0.5)
-    val3 = eval_intersection_polynomial(nodes1, nodes2, 0.75)
-    val4 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] =       [ 3   0    0    0    0 ][n0]
-    # [c1] = 1 / 3 [-25  48  -36   16  -3 ][n1]
-    # [c2] =       [ 70 -208  228 -112  22][n2]
-    # [c3] =       [-80  288 -384  224 -48][n3]
-    # [c4] =       [ 32 -128  192 -128  32][n4]
-    # Since polynomial coefficients, we don't need to divide by 3
-    # to get the same polynomial. Avoid the division to avoid round-off.
-    return np.asfortranarray(
-        [
-            3.0 * val0,
-            -25.0 * val0
-            + 48.0 * val1
-            - 36.0 * val2
-            + 16.0 * val3
-            - 3.0 * val4,
-            70.0 * val0
-            - 208.0 * val1
-            + 228.0 * val2
-            - 112.0 * val3
-            + 22.0 * val4,
-            (
-                -80.0 * val0
-                + 288.0 * val1
-                - 384.0 * val2
-                + 224.0 * val3
-                - 48.0 * val4
-            ),
-            32.0 * val0
-            - 128.0 * val1
-            + 192.0 * val2
-            - 128.0 * val3
-            + 32.0 * val4,
-        ]
+    if nodes1.ndim > 2:
+        # NOTE: For stacks of curves, the implicitized line is the (only)
+        #       minor M_01.
+        return _sylvester_minors(nodes1, nodes2)[..., 0, 1, :]
+
+    # NOTE: With array arguments, ``_evaluate1()`` returns a new array, so
+    #       it can be converted in place. However, for integer nodes that
+    #       array is also integer, so it must be converted to ``float64``
+    #       (which doesn't copy if it already is).
+    coeffs = np.asarray(
+        _evaluate1(nodes1, nodes2[0, :], nodes2[1, :]), dtype=np.float64
     )
+    return _bernstein_to_power(coeffs)
 
 
-def _to_power_basis23(nodes1, nodes2):
+def _to_power_basis_quadratic(nodes1, nodes2):
     r"""Compute the coefficients of an **intersection polynomial**.
 
     Helper for :func:`to_power_basis` in the case that the first curve is
-    degree two and the second is degree three. In this case, B |eacute| zout's
-    `theorem`_ tells us that the **intersection polynomial** is
-    degree :math:`2 \cdot 3` hence we return seven coefficients.
-
-    .. note::
+    degree two. In this case, B |eacute| zout's `theorem`_ tells us that
+    the **intersection polynomial** is degree :math:`2 \cdot d_2`, where
+    :math:`d_2` is the degree of the second curve.
 
-       This uses a least-squares fit to the function evaluated at the
-       Chebyshev nodes (scaled and shifted onto ``[0, 1]``). Hence, the
-       coefficients may be less stable than those produced for smaller
-       degrees.
+    The implicitized curve is a :math:`2 \times 2` determinant of affine
+    minors (see :func:`_sylvester_minors`), so the coefficients are
+    computed directly by multiplying polynomials, rather than by fitting
+    to samples of the **intersection polynomial**.
 
     Args:
         nodes1 (numpy.ndarray): The nodes in the first curve.
         nodes2 (numpy.ndarray): The nodes in the second curve.
 
     Returns:
-        numpy.ndarray: ``7``-array of coefficients.
+        numpy.ndarray: Array of coefficients.
     """
-    evaluated = [
-        eval_intersection_polynomial(nodes1, nodes2, t_val) for t_val in _CHEB7
-    ]
-    return polynomial.polyfit(_CHEB7, evaluated, 6)
+    minors = _sylvester_minors(nodes1, nodes2)
+    minor01 = minors[..., 0, 1, :]
+    minor02 = minors[..., 0, 2, :]
+    minor12 = minors[..., 1, 2, :]
+    #       [M01, M02]
+    # - det [M02, M12] (the sign agrees with ``_evaluate2``)
+    return _polymul(minor02, minor02) - _polymul(minor01, minor12)
 
 
-def _to_power_basis_degree8(nodes1, nodes2):
+def _to_power_basis_cubic(nodes1, nodes2):
     r"""Compute the coefficients of an **intersection polynomial**.
 
-    Helper for :func:`to_power_basis` in the case that B |eacute| zout's
-    `theorem`_ tells us the **intersection polynomial** is degree
-    :math:`8`. This happens if the two curves have degrees one and eight
-    or have degrees two and four.
-
-    .. note::
+    Helper for :func:`to_power_basis` in the case that each curve is
+    degree three. In this case, B |eacute| zout's `theorem`_ tells us
+    that the **intersection polynomial** is degree :math:`3 \cdot 3`
+    hence we return ten coefficients.
 
-       This uses a least-squares fit to the function evaluated at the
-       Chebyshev nodes (scaled and shifted onto ``[0, 1]``). Hence, the
-       coefficients may be less stable than those produced for smaller
-       degrees.
+    The implicitized curve is the determinant of a :math:`3 \times 3`
+    Bezout matrix of affine minors (see :func:`_sylvester_minors`), so
+    the coefficients are computed directly by multiplying polynomials,
+    rather than by fitting to samples of the
+    **intersection polynomial**.
 
     Args:
         nodes1 (numpy.ndarray): The nodes in the first curve.
         nodes2 (numpy.ndarray): The nodes in the second curve.
 
     Returns:
-        numpy.ndarray: ``9``-array of coefficients.
+        numpy.ndarray: ``10``-array of coefficients.
     """
-    evaluated = [
-        eval_intersection_polynomial(nodes1, nodes2, t_val) for t_val in _CHEB9
-    ]
-    return polynomial.polyfit(_CHEB9, evaluated, 8)
+    minors = _sylvester_minors(nodes1, nodes2)
+    minor01 = minors[..., 0, 1, :]
+    minor02 = minors[..., 0, 2, :]
+    minor03 = minors[..., 0, 3, :]
+    minor13 = minors[..., 1, 3, :]
+    minor23 = minors[..., 2, 3, :]
+    minor_mid = minor03 + minors[..., 1, 2, :]
+    #     [M01, M02,       M03]
+    # det [M02, M03 + M12, M13]
+    #     [M03, M13,       M23]
+    return (
+        _polymul(
+            minor01,
+            _polymul(minor_mid, minor23) - _polymul(minor13, minor13),
+        )
+        - _polymul(
+            minor02,
+            _polymul(minor02, minor23) - _polymul(minor13, minor03),
+        )
+        + _polymul(
+            minor03,
+            _polymul(minor02, minor13) - _polymul(minor_mid, minor03),
+        )
+    )
 
 
-def _to_power_basis33(nodes1, nodes2):
-    r"""Compute the coefficients of an **intersection polynomial**.
+# NOTE: These map the number of nodes in each curve to the helper for that
+#       pair of degrees.
+_POWER_BASIS_HELPERS = {
+    (2, 2): _to_power_basis_linear,
+    (2, 3): _to_power_basis_linear,
+    (2, 4): _to_power_basis_linear,
+    (2, 5): _to_power_basis_linear,
+    (3, 3): _to_power_basis_quadratic,
+    (3, 4): _to_power_basis_quadratic,
+    (3, 5): _to_power_basis_quadratic,
+    (4, 4): _to_power_basis_cubic,
+}
 
-    Helper for :func:`to_power_basis` in the case that each curve is
-    degree three. In this case, B |eacute| zout's `theorem`_ tells us
-    that the **intersection polynomial** is degree :math:`3 \cdot 3`
-    hence we return ten coefficients.
 
-    .. note::
+def _power_basis_helper(num_nodes1, num_nodes2):
+    """Get the helper that computes an **intersection polynomial**.
+
+    Args:
+        num_nodes1 (int): The number of nodes in the first curve.
+        num_nodes2 (int): The number of nodes in the second curve.
+
+    Returns:
+        Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]: The
+        helper for this pair of degrees.
+
+    Raises:
+        NotImplementedError: If the degree pair is not ``1-1``, ``1-2``,
+            ``1-3``, ``1-4``, ``2-2``, ``2-3``, ``2-4`` or ``3-3``.
+    """
+    helper = _POWER_BASIS_HELPERS.get((num_nodes1, num_nodes2))
+    if helper is None:
+        raise NotImplementedError(
+            "Degree 1",
+            num_nodes1 - 1,
+            "Degree 2",
+            num_nodes2 - 1,
+            _POWER_BASIS_ERR,
+        )
+
+    return helper
 
-       This uses a least-squares fit to the function evaluated at the
-       Chebyshev nodes (scaled and shifted onto ``[0, 1]``). Hence, the
-       coefficients may be less stable than those produced for smaller
-       degrees.
+
+def _to_power_basis(nodes1, nodes2):
+    """Compute the coefficients of an **intersection polynomial**.
+
+    Helper for :func:`to_power_basis` which does the actual computation
+    (i.e. without using the cache).
 
     Args:
         nodes1 (numpy.ndarray): The nodes in the first curve.
         nodes2 (numpy.ndarray): The nodes in the second curve.
 
     Returns:
-        numpy.ndarray: ``10``-array of coefficients.
+        numpy.ndarray: Array of coefficients.
+
+    Raises:
+        NotImplementedError: If the degree pair is not ``1-1``, ``1-2``,
+            ``1-3``, ``1-4``, ``2-2``, ``2-3``, ``2-4`` or ``3-3``.
     """
-    evaluated = [
-        eval_intersection_polynomial(nodes1, nodes2, t_val)
-        for t_val in _CHEB10
-    ]
-    return polynomial.polyfit(_CHEB10, evaluated, 9)
+    _, num_nodes1 = nodes1.shape
+    _, num_nodes2 = nodes2.shape
+    helper = _power_basis_helper(num_nodes1, num_nodes2)
+    return helper(nodes1, nodes2)
 
 
 def to_power_basis(nodes1, nodes2):
@@ -492,6 +610,12 @@ def to_power_basis(nodes1, nodes2):
        This requires that the degree of the curve given by ``nodes1`` is
        less than or equal to the degree of that given by ``nodes2``.
 
+    .. note::
+
+       Results are cached based on the contents of ``nodes1`` and
+       ``nodes2``. Each call returns a new copy of the coefficients, so
+       callers may modify the result.
+
     Args:
         nodes1 (numpy.ndarray): The nodes in the first curve.
         nodes2 (numpy.ndarray): The nodes in the second curve.
@@ -503,45 +627,77 @@ def to_power_basis(nodes1, nodes2):
         NotImplementedError: If the degree pair is not ``1-1``, ``1-2``,
             ``1-3``, ``1-4``, ``2-2``, ``2-3``, ``2-4`` or ``3-3``.
     """
-    # NOTE: There is no corresponding "enable", but the disable only applies
-    #       in this lexical scope.
-    # pylint: disable=too-many-return-statements
-    _, num_nodes1 = nodes1.shape
-    _, num_nodes2 = nodes2.shape
-    if num_nodes1 == 2:
-        if num_nodes2 == 2:
-            return _to_power_basis11(nodes1, nodes2)
-
-        elif num_nodes2 == 3:
-            return _to_power_basis12(nodes1, nodes2)
+    key = (
+        nodes1.dtype.str,
+        nodes1.shape,
+        nodes1.tobytes(),
+        nodes2.dtype.str,
+        nodes2.shape,
+        nodes2.tobytes(),
+    )
+    # NOTE: The cache is shared across threads, so every lookup, insert and
+    #       eviction holds the lock (but the coefficients are computed
+    #       without it).
+    with _POWER_BASIS_LOCK:
+        coeffs = _POWER_BASIS_CACHE.get(key)
+        if coeffs is not None:
+            _POWER_BASIS_CACHE.move_to_end(key)
+    if coeffs is None:
+        coeffs = _to_power_basis(nodes1, nodes2)
+        with _POWER_BASIS_LOCK:
+            _POWER_BASIS_CACHE[key] = coeffs
+            if len(_POWER_BASIS_CACHE) > _POWER_BASIS_CACHE_SIZE:
+                _POWER_BASIS_CACHE.popitem(last=False)
+
+    return coeffs.copy()
+
+
+def to_power_basis_batch(nodes1, nodes2):
+    """Compute the coefficients of many **intersection polynomials**.
+
+    This is a vectorized version of :func:`to_power_basis` for ``K``
+    independent pairs of curves, which computes all of the coefficients at
+    once rather than making one call per pair.
 
-        elif num_nodes2 == 4:
-            return _to_power_basis13(nodes1, nodes2)
+    .. note::
 
-        elif num_nodes2 == 5:
-            return _to_power_basis_degree4(nodes1, nodes2)
+       This requires that every pair has the same degrees, i.e. each
+       curve in the first stack has ``N`` nodes and each curve in the
+       second stack has ``M`` nodes. Results are **not** cached.
 
-    elif num_nodes1 == 3:
-        if num_nodes2 == 3:
-            return _to_power_basis_degree4(nodes1, nodes2)
+    Args:
+        nodes1 (numpy.ndarray): ``K x 2 x N`` array of the nodes in each
+            first curve.
+        nodes2 (numpy.ndarray): ``K x 2 x M`` array of the nodes in each
+            second curve.
 
-        elif num_nodes2 == 4:
-            return _to_power_basis23(nodes1, nodes2)
+    Returns:
+        numpy.ndarray: ``K x D`` array of coefficients, where each row
+        holds the coefficients of one **intersection polynomial**.
 
-        elif num_nodes2 == 5:
-            return _to_power_basis_degree8(nodes1, nodes2)
+    Raises:
+        ValueError: If ``nodes1`` or ``nodes2`` is not 3-dimensional.
+        ValueError: If ``nodes1`` and ``nodes2`` do not contain the same
+            number of curves.
+        NotImplementedError: If the degree pair is not ``1-1``, ``1-2``,
+            ``1-3``, ``1-4``, ``2-2``, ``2-3``, ``2-4`` or ``3-3``.
+    """
+    if nodes1.ndim != 3 or nodes2.ndim != 3:
+        raise ValueError(
+            "Nodes must be 3-dimensional, not", nodes1.ndim, nodes2.ndim
+        )
 
-    elif num_nodes1 == 4:
-        if num_nodes2 == 4:
-            return _to_power_basis33(nodes1, nodes2)
+    num_pairs1, _, num_nodes1 = nodes1.shape
+    num_pairs2, _, num_nodes2 = nodes2.shape
+    if num_pairs1 != num_pairs2:
+        raise ValueError(
+            "Nodes must contain the same number of curves",
+            num_pairs1,
+            num_pairs2,
+        )
 
-    raise NotImplementedError(
-        "Degree 1",
-        num_nodes1 - 1,
-        "Degree 2",
-        num_nodes2 - 1,
-        _POWER_BASIS_ERR,
-    )
+    helper = _power_basis_helper(num_nodes1, num_nodes2)
+    return helper(nodes1, nodes2)
 
 
 def polynomial_norm(coeffs):
@@ -1291,11 +1447,14 @@ def intersect_curves(nodes1, nodes2):
     t_vals = roots_in_unit_interval(coeffs)
     final_s = []
     final_t = []
+    # NOTE: Each root is located on the same curve, so the work that only
+    #       depends on ``nodes1`` is shared.
+    locate = _locate_point_factory(nodes1)
     for t_val in t_vals:
         (x_val,), (y_val,) = _curve_helpers.evaluate_multi(
-            nodes2, np.asfortranarray([t_val])
+            nodes2, _scratch_s(t_val)
         )
-        s_val = locate_point(nodes1, x_val, y_val)
+        s_val = locate(x_val, y_val)
         if s_val is not None:
             _resolve_and_add(nodes1, s_val, final_s, nodes2, t_val, final_t)
     result = np.zeros((2, len(final_s)), order="F")
@@ -1363,48 +1522,96 @@ def poly_to_power_basis(bezier_coeffs):
         )
 
 
-def locate_point(nodes, x_val, y_val):
-    r"""Find the parameter corresponding to a point on a curve.
+def _locate_point_factory(nodes):
+    r"""Prepare to find the parameters of many points on a curve.
 
-    .. note::
+    Helper for :func:`locate_point`. The work that only depends on
+    ``nodes`` (reducing :math:`x(s)` and :math:`y(s)` to their true degree
+    and converting each to the power basis) is done once, so that locating
+    each point only requires shifting the constant terms and finding roots.
 
-       This assumes that the curve :math:`B(s, t)` defined by ``nodes``
-       lives in :math:`\mathbf{R}^2`.
+    This works since the coefficients in the power basis of
+    :math:`x(s) - x` only differ from those of :math:`x(s)` in the
+    constant term.
 
     Args:
         nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
-        x_val (float): The :math:`x`-coordinate of the point.
-        y_val (float): The :math:`y`-coordinate of the point.
 
     Returns:
-        Optional[float]: The parameter on the curve (if it exists).
+        Callable[[float, float], Optional[float]]: Function which takes the
+        :math:`x`- and :math:`y`-coordinates of a point and returns the
+        parameter on the curve (if it exists).
     """
     # First, reduce to the true degree of x(s) and y(s).
-    zero1 = _curve_helpers.full_reduce(nodes[[0], :]) - x_val
-    zero2 = _curve_helpers.full_reduce(nodes[[1], :]) - y_val
+    reduced1 = _curve_helpers.full_reduce(nodes[[0], :])
+    reduced2 = _curve_helpers.full_reduce(nodes[[1], :])
     # Make sure we have the lowest degree in front, to make the polynomial
     # solve have the fewest number of roots.
-    if zero1.shape[1] > zero2.shape[1]:
-        zero1, zero2 = zero2, zero1
+    swapped = reduced1.shape[1] > reduced2.shape[1]
+    if swapped:
+        reduced1, reduced2 = reduced2, reduced1
     # If the "smallest" is a constant, we can't find any roots from it.
-    if zero1.shape[1] == 1:
+    if reduced1.shape[1] == 1:
         # NOTE: We assume that callers won't pass ``nodes`` that are
-        #       degree 0, so if ``zero1`` is a constant, ``zero2`` won't be.
-        zero1, zero2 = zero2, zero1
-    power_basis1 = poly_to_power_basis(zero1[0, :])
-    all_roots = roots_in_unit_interval(power_basis1)
-    if all_roots.size == 0:
+        #       degree 0, so if ``reduced1`` is a constant, ``reduced2``
+        #       won't be.
+        reduced1, reduced2 = reduced2, reduced1
+        swapped = not swapped
+    power_basis1 = poly_to_power_basis(reduced1[0, :])
+    power_basis2 = poly_to_power_basis(reduced2[0, :])
+
+    def locate(x_val, y_val):
+        """Find the parameter corresponding to a point on the curve.
+
+        Args:
+            x_val (float): The :math:`x`-coordinate of the point.
+            y_val (float): The :math:`y`-coordinate of the point.
+
+        Returns:
+            Optional[float]: The parameter on the curve (if it exists).
+        """
+        if swapped:
+            x_val, y_val = y_val, x_val
+        # NOTE: ``astype()`` copies, and also promotes the coefficients of
+        #       integer nodes so they can be shifted in place.
+        zero1 = power_basis1.astype(np.float64)
+        zero1[0] -= x_val
+        all_roots = roots_in_unit_interval(zero1)
+        if all_roots.size == 0:
+            return None
+
+        # NOTE: We normalize ``zero2`` because we want to check for
+        #       "zero" values, i.e. f2(s) == 0.
+        zero2 = power_basis2.astype(np.float64)
+        zero2[0] -= y_val
+        zero2 = normalize_polynomial(zero2)
+        near_zero = np.abs(polynomial.polyval(all_roots, zero2))
+        index = np.argmin(near_zero)
+        if near_zero[index] < _ZERO_THRESHOLD:
+            return all_roots[index]
+
         return None
 
-    # NOTE: We normalize ``power_basis2`` because we want to check for
-    #       "zero" values, i.e. f2(s) == 0.
-    power_basis2 = normalize_polynomial(poly_to_power_basis(zero2[0, :]))
-    near_zero = np.abs(polynomial.polyval(all_roots, power_basis2))
-    index = np.argmin(near_zero)
-    if near_zero[index] < _ZERO_THRESHOLD:
-        return all_roots[index]
+    return locate
+
 
-    return None
+def locate_point(nodes, x_val, y_val):
+    r"""Find the parameter corresponding to a point on a curve.
+
+    .. note::
+
+       This assumes that the curve :math:`B(s, t)` defined by ``nodes``
+       lives in :math:`\mathbf{R}^2`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        x_val (float): The :math:`x`-coordinate of the point.
+        y_val (float): The :math:`y`-coordinate of the point.
+
+    Returns:
+        Optional[float]: The parameter on the curve (if it exists).
+    """
+    return _locate_point_factory(nodes)(x_val, y_val)
 
 
 def all_intersections(nodes_first, nodes_second):
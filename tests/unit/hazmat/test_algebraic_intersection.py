@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import unittest
 import unittest.mock
 
@@ -146,6 +147,35 @@ class Test_evaluate(unittest.TestCase):
         self.assertEqual(exc_info.exception.supported, (1, 2, 3))
 
 
+class Test__scratch_s(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(s_val):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._scratch_s(s_val)
+
+    def test_it(self):
+        s_vals1 = self._call_function_under_test(0.25)
+        self.assertEqual(s_vals1, np.asfortranarray([0.25]))
+        s_vals2 = self._call_function_under_test(0.5)
+        self.assertIs(s_vals1, s_vals2)
+        self.assertEqual(s_vals2, np.asfortranarray([0.5]))
+
+    def test_per_thread(self):
+        s_vals1 = self._call_function_under_test(0.25)
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(self._call_function_under_test(1.0))
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(len(results), 1)
+        s_vals2 = results[0]
+        self.assertIsNot(s_vals1, s_vals2)
+        self.assertEqual(s_vals1, np.asfortranarray([0.25]))
+        self.assertEqual(s_vals2, np.asfortranarray([1.0]))
+
+
 class Test_eval_intersection_polynomial(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(nodes1, nodes2, t):
@@ -186,32 +216,97 @@ class Test_eval_intersection_polynomial(unittest.TestCase):
         self.assertEqual(values, expected)
 
 
-class Test__to_power_basis11(utils.NumPyTestCase):
+class Test__bernstein_to_power(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._bernstein_to_power(coeffs)
+
+    def test_it(self):
+        # 2 (1 - t)^2 + 2 t (1 - t) + 3 t^2 = 2 - 2 t + 3 t^2
+        coeffs = np.asfortranarray([2.0, 1.0, 3.0])
+        result = self._call_function_under_test(coeffs)
+        self.assertIs(result, coeffs)
+        expected = np.asfortranarray([2.0, -2.0, 3.0])
+        self.assertEqual(result, expected)
+
+    def test_multiple(self):
+        coeffs = np.asfortranarray(
+            [[1.0, 1.0, 1.0, 1.0], [0.0, 0.0, 0.0, 1.0]]
+        )
+        result = self._call_function_under_test(coeffs)
+        expected = np.asfortranarray(
+            [[1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+        )
+        self.assertEqual(result, expected)
+
+
+class Test__sylvester_minors(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes1, nodes2):
         from bezier.hazmat import algebraic_intersection
 
-        return algebraic_intersection._to_power_basis11(nodes1, nodes2)
+        return algebraic_intersection._sylvester_minors(nodes1, nodes2)
 
     def test_it(self):
-        # f1(x, y) = -(12 x - 8 y + 5) / 32
-        nodes1 = np.asfortranarray([[0.0, 0.25], [0.625, 1.0]])
-        # x2(t), y2(t) = (2 - 3 t) / 4, (3 t + 2) / 4
-        nodes2 = np.asfortranarray([[0.5, -0.25], [0.5, 1.25]])
-        # f1(x2(t), y2(t)) = (15 t - 7) / 32
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        # x2(t), y2(t) = 2 t, 1
+        nodes2 = np.asfortranarray([[0.0, 2.0], [1.0, 1.0]])
         result = self._call_function_under_test(nodes1, nodes2)
-        expected = np.asfortranarray([-7.0, 15.0]) / 32.0
+        self.assertEqual(result.shape, (3, 3, 2))
+        # M01 = (0 - x) (4 - 2 y) - (2 - 2 x) (0 - y) = 2 y - 4 x
+        # M02 = (0 - x) (0 - y) - (2 - x) (0 - y) = 2 y
+        # M12 = (2 - 2 x) (0 - y) - (2 - x) (4 - 2 y) = 2 y + 4 x - 8
+        self.assertEqual(result[0, 1, :], np.asfortranarray([2.0, -8.0]))
+        self.assertEqual(result[0, 2, :], np.asfortranarray([2.0, 0.0]))
+        self.assertEqual(result[1, 2, :], np.asfortranarray([-6.0, 8.0]))
+        self.assertTrue(np.all(result == -np.swapaxes(result, 0, 1)))
+
+
+class Test__polymul(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs1, coeffs2):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._polymul(coeffs1, coeffs2)
+
+    def test_single(self):
+        # (1 + 2 t) (3 - t + t^2) = 3 + 5 t - t^2 + 2 t^3
+        coeffs1 = np.asfortranarray([1.0, 2.0])
+        coeffs2 = np.asfortranarray([3.0, -1.0, 1.0])
+        result = self._call_function_under_test(coeffs1, coeffs2)
+        expected = np.asfortranarray([3.0, 5.0, -1.0, 2.0])
+        self.assertEqual(result, expected)
+
+    def test_stacked(self):
+        coeffs1 = np.asfortranarray([[1.0, 2.0], [0.0, 1.0]])
+        coeffs2 = np.asfortranarray([[3.0, -1.0, 1.0], [1.0, 1.0, 0.0]])
+        result = self._call_function_under_test(coeffs1, coeffs2)
+        expected = np.asfortranarray(
+            [[3.0, 5.0, -1.0, 2.0], [0.0, 1.0, 1.0, 0.0]]
+        )
         self.assertEqual(result, expected)
 
 
-class Test__to_power_basis12(utils.NumPyTestCase):
+class Test__to_power_basis_linear(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes1, nodes2):
         from bezier.hazmat import algebraic_intersection
 
-        return algebraic_intersection._to_power_basis12(nodes1, nodes2)
+        return algebraic_intersection._to_power_basis_linear(nodes1, nodes2)
 
-    def test_it(self):
+    def test_degrees_1_1(self):
+        # f1(x, y) = -(12 x - 8 y + 5) / 32
+        nodes1 = np.asfortranarray([[0.0, 0.25], [0.625, 1.0]])
+        # x2(t), y2(t) = (2 - 3 t) / 4, (3 t + 2) / 4
+        nodes2 = np.asfortranarray([[0.5, -0.25], [0.5, 1.25]])
+        # f1(x2(t), y2(t)) = (15 t - 7) / 32
+        result = self._call_function_under_test(nodes1, nodes2)
+        expected = np.asfortranarray([-7.0, 15.0]) / 32.0
+        self.assertEqual(result, expected)
+
+    def test_degrees_1_2(self):
         # f1(x, y) = (2 y - 1) / 2
         nodes1 = np.asfortranarray([[0.0, 1.0], [0.5, 0.5]])
         # x2(t), y2(t) = t, 2 t (1 - t)
@@ -221,15 +316,7 @@ class Test__to_power_basis12(utils.NumPyTestCase):
         expected = np.asfortranarray([-0.5, 2.0, -2.0])
         self.assertEqual(result, expected)
 
-
-class Test__to_power_basis13(utils.NumPyTestCase):
-    @staticmethod
-    def _call_function_under_test(nodes1, nodes2):
-        from bezier.hazmat import algebraic_intersection
-
-        return algebraic_intersection._to_power_basis13(nodes1, nodes2)
-
-    def test_it(self):
+    def test_degrees_1_3(self):
         # f1(x, y) = -(152 x + 112 y - 967) / 64
         nodes1 = np.asfortranarray([[2.5625, 0.8125], [5.15625, 7.53125]])
         # x2(t), y2(t) = 3 (14 t + 1) / 8, 18 t^3 - 27 t^2 + 3 t + 7
@@ -238,19 +325,37 @@ class Test__to_power_basis13(utils.NumPyTestCase):
         )
         # f1(x2(t), y2(t)) = -63 (t - 1) (4 t - 1)^2 / 32
         result = self._call_function_under_test(nodes1, nodes2)
-        # The 1-3 method avoids a division by 3.0
-        expected = (
-            3.0 * (-63.0 / 32.0) * np.asfortranarray([-1.0, 9.0, -24.0, 16.0])
+        expected = (-63.0 / 32.0) * np.asfortranarray([-1.0, 9.0, -24.0, 16.0])
+        self.assertEqual(result, expected)
+
+    def test_degrees_1_4(self):
+        # f1(x, y) = 4 (y - 3)
+        nodes1 = np.asfortranarray([[0.0, 4.0], [3.0, 3.0]])
+        # x2(t), y2(t) = 4 s, 2 s (s - 1) (5 s^2 - 5 s - 2)
+        nodes2 = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 1.0, 3.0, 1.0, 0.0]]
         )
+        # f1(x2(t), y2(t)) = 4 (10 t^4 - 20 t^3 + 6 t^2 + 4 t - 3)
+        result = self._call_function_under_test(nodes1, nodes2)
+        expected = np.asfortranarray([-12.0, 16.0, 24.0, -80.0, 40.0])
+        self.assertEqual(result, expected)
+
+    def test_integer_nodes(self):
+        # f1(x, y) = 4 (y - 3)
+        nodes1 = np.asfortranarray([[0, 4], [3, 3]])
+        # x2(t), y2(t) = 2 t, 6 t
+        nodes2 = np.asfortranarray([[0, 2], [0, 6]])
+        result = self._call_function_under_test(nodes1, nodes2)
+        expected = np.asfortranarray([-12.0, 24.0])
         self.assertEqual(result, expected)
 
 
-class Test__to_power_basis_degree4(utils.NumPyTestCase):
+class Test__to_power_basis_quadratic(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes1, nodes2):
         from bezier.hazmat import algebraic_intersection
 
-        return algebraic_intersection._to_power_basis_degree4(nodes1, nodes2)
+        return algebraic_intersection._to_power_basis_quadratic(nodes1, nodes2)
 
     def test_degrees_2_2(self):
         # f1(x, y) = (x^2 - 4 x y + 4 y^2 - y) / 16
@@ -261,34 +366,12 @@ class Test__to_power_basis_degree4(utils.NumPyTestCase):
         nodes2 = np.asfortranarray([[0.75, -0.25, -0.25], [0.25, -0.25, 0.25]])
         # f1(x2(t), y2(t)) = (2 t - 1)^3 (2 t + 3) / 256
         result = self._call_function_under_test(nodes1, nodes2)
-        # The function avoids a division by 3.0
-        expected = (3.0 / 256.0) * np.asfortranarray(
+        expected = (1.0 / 256.0) * np.asfortranarray(
             [-3.0, 16.0, -24.0, 0.0, 16.0]
         )
         self.assertEqual(result, expected)
 
-    def test_degrees_1_4(self):
-        # f1(x, y) = 4 (y - 3)
-        nodes1 = np.asfortranarray([[0.0, 4.0], [3.0, 3.0]])
-        # x2(t), y2(t) = 4 s, 2 s (s - 1) (5 s^2 - 5 s - 2)
-        nodes2 = np.asfortranarray(
-            [[0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 1.0, 3.0, 1.0, 0.0]]
-        )
-        # f1(x2(t), y2(t)) = 4 (10 t^4 - 20 t^3 + 6 t^2 + 4 t - 3)
-        result = self._call_function_under_test(nodes1, nodes2)
-        # The function avoids a division by 3.0
-        expected = 3.0 * np.asfortranarray([-12.0, 16.0, 24.0, -80.0, 40.0])
-        self.assertEqual(result, expected)
-
-
-class Test__to_power_basis23(utils.NumPyTestCase):
-    @staticmethod
-    def _call_function_under_test(nodes1, nodes2):
-        from bezier.hazmat import algebraic_intersection
-
-        return algebraic_intersection._to_power_basis23(nodes1, nodes2)
-
-    def test_it(self):
+    def test_degrees_2_3(self):
         # f1(x, y) = 4 (4 x^2 - 12 x - 4 y + 11)
         nodes1 = np.asfortranarray([[0.5, 1.5, 2.5], [1.5, -0.5, 1.5]])
         # x2(t), y2(t) = 3 t, t (4 t^2 - 6 t + 3)
@@ -298,15 +381,7 @@ class Test__to_power_basis23(utils.NumPyTestCase):
         # f1(x2(t), y2(t)) = 4 (2 s - 1)^2 (4 s - 11)
         result = self._call_function_under_test(nodes1, nodes2)
         expected = np.asfortranarray([44, -192, 240, -64, 0.0, 0.0, 0.0])
-        self.assertLess(np.abs(result - expected).max(), LOCAL_EPS)
-
-
-class Test__to_power_basis_degree8(utils.NumPyTestCase):
-    @staticmethod
-    def _call_function_under_test(nodes1, nodes2):
-        from bezier.hazmat import algebraic_intersection
-
-        return algebraic_intersection._to_power_basis_degree8(nodes1, nodes2)
+        self.assertEqual(result, expected)
 
     def test_degrees_2_4(self):
         # f1(x, y) = 2 (9 x - 2 y^2 - 6 y)
@@ -322,15 +397,15 @@ class Test__to_power_basis_degree8(utils.NumPyTestCase):
         expected = np.asfortranarray(
             [0.0, -24.0, 136.0, 192.0, 60.0, -224.0, -336.0, 0.0, 196.0]
         )
-        self.assertLess(np.abs(result - expected).max(), LOCAL_EPS)
+        self.assertEqual(result, expected)
 
 
-class Test__to_power_basis33(utils.NumPyTestCase):
+class Test__to_power_basis_cubic(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes1, nodes2):
         from bezier.hazmat import algebraic_intersection
 
-        return algebraic_intersection._to_power_basis33(nodes1, nodes2)
+        return algebraic_intersection._to_power_basis_cubic(nodes1, nodes2)
 
     def test_it(self):
         # f1(x, y) = x^3 - 9 x^2 + 27 x - 27 y
@@ -347,7 +422,7 @@ class Test__to_power_basis33(utils.NumPyTestCase):
         expected = np.asfortranarray(
             [-62, 81, 0, -12, 0, 0, -6, 0, 0, -1], dtype=FLOAT64
         )
-        self.assertLess(np.abs(result - expected).max(), 2.0 * LOCAL_EPS)
+        self.assertEqual(result, expected)
 
 
 class Test_to_power_basis(utils.NumPyTestCase):
@@ -386,8 +461,7 @@ class Test_to_power_basis(utils.NumPyTestCase):
         )
         # f1(x2(t), y2(t)) = -(t^3 + 3 t^2 - 3) / 4
         result = self._call_function_under_test(nodes1, nodes2)
-        # The 1-3 method avoids a division by 3.0
-        expected = 3.0 * np.asfortranarray([0.75, 0.0, -0.75, -0.25])
+        expected = np.asfortranarray([0.75, 0.0, -0.75, -0.25])
         self.assertEqual(result, expected)
 
     def test_degrees_1_4(self):
@@ -399,8 +473,7 @@ class Test_to_power_basis(utils.NumPyTestCase):
         )
         # f1(x2(t), y2(t)) = 4 t (1 - t) (7 t^2 + 7 t + 1)
         result = self._call_function_under_test(nodes1, nodes2)
-        # The function avoids a division by 3.0
-        expected = 3.0 * np.asfortranarray([0.0, 4.0, 24.0, 0.0, -28.0])
+        expected = np.asfortranarray([0.0, 4.0, 24.0, 0.0, -28.0])
         self.assertEqual(result, expected)
 
     def test_degrees_2_2(self):
@@ -410,8 +483,7 @@ class Test_to_power_basis(utils.NumPyTestCase):
         nodes2 = np.asfortranarray([[1.0, 0.1875, 0.0], [1.0, 0.9375, 0.0]])
         # f1(x2(t), y2(t)) = (9 t^4 - 18 t^3 + 5 t^2 - 28 t + 12) / 16
         result = self._call_function_under_test(nodes1, nodes2)
-        # The function avoids a division by 3.0
-        expected = (3.0 / 16.0) * np.asfortranarray(
+        expected = (1.0 / 16.0) * np.asfortranarray(
             [12.0, -28.0, 5.0, -18.0, 9.0]
         )
         self.assertEqual(result, expected)
@@ -485,6 +557,95 @@ class Test_to_power_basis(utils.NumPyTestCase):
             np.allclose(result, expected, atol=0.0, rtol=LOCAL_EPS)
         )
 
+    def test_cached(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes1 = np.asfortranarray([[0.0, 6.0], [8.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 4.5, 9.0], [0.0, 9.0, 0.0]])
+        cache = algebraic_intersection._POWER_BASIS_CACHE
+        with unittest.mock.patch.dict(cache, clear=True):
+            result1 = self._call_function_under_test(nodes1, nodes2)
+            result2 = self._call_function_under_test(
+                np.array(nodes1), np.array(nodes2)
+            )
+            self.assertEqual(len(cache), 1)
+            # Modifying a result does not modify the cached coefficients.
+            result1[0] = 0.0
+            (cached,) = cache.values()
+        self.assertIsNot(result1, result2)
+        expected = np.asfortranarray([-48.0, 180.0, -108.0])
+        self.assertEqual(result2, expected)
+        self.assertEqual(cached, expected)
+
+    def test_cache_dtype(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes1 = np.asfortranarray([[1.0, 3.0], [0.5, 0.5]])
+        nodes2 = np.asfortranarray([[0.0, 0.0], [0.0, 1.0]])
+        # Same shape and the same raw bytes, but a different ``dtype``.
+        nodes1_int = nodes1.view(np.int64)
+        nodes2_int = nodes2.view(np.int64)
+        cache = algebraic_intersection._POWER_BASIS_CACHE
+        with unittest.mock.patch.dict(cache, clear=True):
+            result1 = self._call_function_under_test(nodes1, nodes2)
+            result2 = self._call_function_under_test(nodes1_int, nodes2_int)
+            self.assertEqual(len(cache), 2)
+        self.assertEqual(result1, np.asfortranarray([-1.0, 2.0]))
+        expected2 = algebraic_intersection._to_power_basis(
+            nodes1_int, nodes2_int
+        )
+        self.assertEqual(result2, expected2)
+
+    def test_cache_eviction(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes1 = np.asfortranarray([[0.0, 0.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[1.0, 1.0], [0.0, 1.0]])
+        nodes3 = np.asfortranarray([[2.0, 2.0], [0.0, 1.0]])
+        cache = algebraic_intersection._POWER_BASIS_CACHE
+        patch_size = unittest.mock.patch.object(
+            algebraic_intersection, "_POWER_BASIS_CACHE_SIZE", new=1
+        )
+        with unittest.mock.patch.dict(cache, clear=True), patch_size:
+            result1 = self._call_function_under_test(nodes1, nodes2)
+            result2 = self._call_function_under_test(nodes1, nodes3)
+            self.assertEqual(len(cache), 1)
+            (cached,) = cache.values()
+            self.assertEqual(cached, result2)
+        self.assertEqual(result1, np.asfortranarray([-1.0, 0.0]))
+        self.assertEqual(result2, np.asfortranarray([-2.0, 0.0]))
+
+    def test_cache_threads(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes1 = np.asfortranarray([[0.0, 0.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[1.0, 1.0], [0.0, 1.0]])
+        nodes3 = np.asfortranarray([[2.0, 2.0], [0.0, 1.0]])
+        cache = algebraic_intersection._POWER_BASIS_CACHE
+        patch_size = unittest.mock.patch.object(
+            algebraic_intersection, "_POWER_BASIS_CACHE_SIZE", new=1
+        )
+        errors = []
+
+        def target(other_nodes):
+            try:
+                for _ in range(200):
+                    self._call_function_under_test(nodes1, other_nodes)
+            except KeyError as exc:  # pragma: NO COVER
+                errors.append(exc)
+
+        with unittest.mock.patch.dict(cache, clear=True), patch_size:
+            threads = [
+                threading.Thread(target=target, args=(other_nodes,))
+                for other_nodes in (nodes2, nodes3, nodes2, nodes3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(cache), 1)
+        self.assertEqual(errors, [])
+
     def test_unsupported(self):
         nodes_yes1 = np.zeros((2, 2), order="F")
         nodes_yes2 = np.zeros((2, 3), order="F")
@@ -501,6 +662,87 @@ class Test_to_power_basis(utils.NumPyTestCase):
         with self.assertRaises(NotImplementedError):
             self._call_function_under_test(nodes_no, nodes_no)
 
+    def test_stacked(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes = np.zeros((3, 2, 3), order="F")
+        cache = algebraic_intersection._POWER_BASIS_CACHE
+        with unittest.mock.patch.dict(cache, clear=True):
+            with self.assertRaises(ValueError):
+                self._call_function_under_test(nodes, nodes)
+            self.assertEqual(len(cache), 0)
+
+
+class Test_to_power_basis_batch(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection.to_power_basis_batch(nodes1, nodes2)
+
+    def _check_pairs(self, num_nodes1, num_nodes2, seed):
+        from bezier.hazmat import algebraic_intersection
+
+        num_pairs = 4
+        nodes1 = utils.get_random_nodes(
+            shape=(num_pairs, 2, num_nodes1), seed=seed, num_bits=8
+        )
+        nodes2 = utils.get_random_nodes(
+            shape=(num_pairs, 2, num_nodes2), seed=seed + 1, num_bits=8
+        )
+        result = self._call_function_under_test(nodes1, nodes2)
+        degree = (num_nodes1 - 1) * (num_nodes2 - 1)
+        self.assertEqual(result.shape, (num_pairs, degree + 1))
+        for index in range(num_pairs):
+            expected = algebraic_intersection.to_power_basis(
+                np.asfortranarray(nodes1[index]),
+                np.asfortranarray(nodes2[index]),
+            )
+            self.assertTrue(
+                np.allclose(
+                    result[index], expected, atol=LOCAL_EPS, rtol=LOCAL_EPS
+                )
+            )
+
+    def test_degrees_1_3(self):
+        self._check_pairs(2, 4, 9471)
+
+    def test_degrees_2_2(self):
+        self._check_pairs(3, 3, 2047)
+
+    def test_degrees_2_4(self):
+        self._check_pairs(3, 5, 55411)
+
+    def test_degrees_3_3(self):
+        self._check_pairs(4, 4, 12881)
+
+    def test_unsupported(self):
+        nodes1 = np.zeros((3, 2, 3), order="F")
+        nodes2 = np.zeros((3, 2, 6), order="F")
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(nodes1, nodes2)
+
+    def test_not_stacked(self):
+        nodes_single = np.zeros((2, 3), order="F")
+        nodes_stack = np.zeros((3, 2, 3), order="F")
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(nodes_single, nodes_single)
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(nodes_single, nodes_stack)
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(nodes_stack, nodes_single)
+
+    def test_mismatched_stacks(self):
+        nodes1 = np.zeros((3, 2, 3), order="F")
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                nodes1, np.zeros((4, 2, 3), order="F")
+            )
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                nodes1, np.zeros((1, 2, 3), order="F")
+            )
+
 
 class Test_polynomial_norm(unittest.TestCase):
     @staticmethod
@@ -1328,6 +1570,37 @@ class Test_poly_to_power_basis(utils.NumPyTestCase):
         self.assertEqual(exc_info.exception.supported, (0, 1, 2, 3))
 
 
+class Test__locate_point_factory(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._locate_point_factory(nodes)
+
+    def test_reused(self):
+        # x(s), y(s) = s (s + 2), 3 - s (s + 2)
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [3.0, 2.0, 0.0]])
+        locate = self._call_function_under_test(nodes)
+        self.assertEqual(locate(1.25, 1.75), 0.5)
+        self.assertEqual(locate(0.5625, 2.4375), 0.25)
+        self.assertEqual(locate(0.0, 3.0), 0.0)
+        self.assertIsNone(locate(1.25, 1.5))
+
+    def test_integer_nodes(self):
+        # x(s), y(s) = 2 s, 4 s
+        nodes = np.asfortranarray([[0, 2], [0, 4]])
+        locate = self._call_function_under_test(nodes)
+        self.assertEqual(locate(0.5, 1.0), 0.25)
+        self.assertIsNone(locate(0.5, 0.5))
+
+    def test_swapped(self):
+        # x(s), y(s) = 2, 2 s
+        nodes = np.asfortranarray([[2.0, 2.0, 2.0], [0.0, 1.0, 2.0]])
+        locate = self._call_function_under_test(nodes)
+        self.assertEqual(locate(2.0, 1.5), 0.75)
+        self.assertIsNone(locate(1.0, 1.0))
+
+
 class Test_locate_point(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(nodes, x_val, y_val):
@@ -1379,6 +1652,16 @@ class Test_all_intersections(utils.NumPyTestCase):
         self.assertEqual(intersections.shape, (2, 0))
         self.assertFalse(coincident)
 
+    def test_integer_nodes(self):
+        nodes1 = np.asfortranarray([[0, 2], [0, 2]])
+        nodes2 = np.asfortranarray([[0, 2], [2, 0]])
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2
+        )
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(intersections, expected)
+        self.assertFalse(coincident)
+
     def test_success(self):
         # NOTE: ``nodes1`` is a specialization of [0, 0], [1/2, 1], [1, 1]
         #       onto the interval [1/4, 1] and ``nodes`` is a specialization